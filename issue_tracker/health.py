@@ -0,0 +1,28 @@
+"""
+Health check served directly at the WSGI layer.
+
+Railway probes /health/ many times a minute; answering here skips the
+middleware stack, URL resolution and view dispatch for every probe. The
+Django view in urls.py stays in place for runserver and the test client.
+"""
+
+HEALTH_PATH = '/health/'
+HEALTH_BODY = b'{"status": "ok"}'
+
+
+def health_app(environ, start_response):
+    """Bare WSGI callable returning the health payload."""
+    start_response('200 OK', [
+        ('Content-Type', 'application/json'),
+        ('Content-Length', str(len(HEALTH_BODY))),
+    ])
+    return [HEALTH_BODY]
+
+
+def with_health_check(application):
+    """Wrap a WSGI application so health probes never reach Django."""
+    def wrapped(environ, start_response):
+        if environ.get('PATH_INFO') == HEALTH_PATH:
+            return health_app(environ, start_response)
+        return application(environ, start_response)
+    return wrapped
@@ -95,11 +95,23 @@ WSGI_APPLICATION = 'issue_tracker.wsgi.application'
 # Use PostgreSQL if DATABASE_URL is set, otherwise use SQLite for development
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# Keep connections open between requests instead of reconnecting every time;
+# health checks drop connections the server or a pooler has closed meanwhile
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+# Set when running behind PgBouncer in transaction pooling mode, which cannot
+# hold the server-side cursors QuerySet.iterator() opens on PostgreSQL
+DB_DISABLE_SERVER_SIDE_CURSORS = os.getenv('DB_DISABLE_SERVER_SIDE_CURSORS', 'False').lower() == 'true'
+
 if DATABASE_URL:
     # Parse PostgreSQL URL
     import dj_database_url
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL)
+        'default': dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=True,
+            disable_server_side_cursors=DB_DISABLE_SERVER_SIDE_CURSORS,
+        )
     }
 else:
     # Default to PostgreSQL with environment variables, fallback to SQLite
@@ -111,9 +123,25 @@ else:
             'PASSWORD': os.getenv('DB_PASSWORD', ''),
             'HOST': os.getenv('DB_HOST', 'localhost'),
             'PORT': os.getenv('DB_PORT', '5432'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'DISABLE_SERVER_SIDE_CURSORS': DB_DISABLE_SERVER_SIDE_CURSORS,
         }
     }
 
+# Shared by all gunicorn workers, so a write in one process invalidates cached
+# responses in the others; create the table with `manage.py createcachetable`
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    }
+}
+
+# Threads inserting CSV import chunks concurrently, each on its own connection.
+# Only used on PostgreSQL; 1 keeps the whole import in a single transaction
+CSV_IMPORT_WORKERS = int(os.getenv('CSV_IMPORT_WORKERS', '1'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -7,6 +7,7 @@ The `urlpatterns` list routes URLs to views. For more information please see:
 from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
@@ -14,6 +15,9 @@ from drf_spectacular.views import (
 )
 
 
+SCHEMA_CACHE_SECONDS = 60 * 60
+
+
 def health_check(request):
     """Simple health check endpoint for Railway."""
     return JsonResponse({'status': 'ok'})
@@ -30,7 +34,8 @@ urlpatterns = [
     path('api/', include('tracker.urls')),
 
     # API Documentation (Swagger/OpenAPI)
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    # Schema generation introspects every view/serializer; cache the result
+    path('api/schema/', cache_page(SCHEMA_CACHE_SECONDS)(SpectacularAPIView.as_view()), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 
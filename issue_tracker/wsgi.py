@@ -11,6 +11,8 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from .health import with_health_check
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'issue_tracker.settings')
 
-application = get_wsgi_application()
+application = with_health_check(get_wsgi_application())
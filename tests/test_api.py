@@ -1,9 +1,43 @@
+import json
+from functools import lru_cache
+
 import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.test import APIClient
 from django.contrib.auth.models import User
-from tracker.models import Issue, Comment, Label
+from issue_tracker.health import with_health_check
+from tracker.models import Issue, Comment, Label, IssueHistory
+from tracker.serializers import (
+    BULK_STATUS_MAX_ISSUES, IssueHistorySerializer, IssueListSerializer, IssueUpdateSerializer,
+)
+from tracker import views
+from tracker.views import IssueViewSet
+
+
+# Resolve static routes once instead of walking the URL resolver per test
+ISSUE_LIST_URL = reverse('issue-list')
+ISSUE_BULK_STATUS_URL = reverse('issue-bulk-status')
+ISSUE_IMPORT_URL = reverse('issue-import-csv')
+LABEL_LIST_URL = reverse('label-list')
+TOP_ASSIGNEES_URL = reverse('top-assignees')
+LATENCY_REPORT_URL = reverse('latency-report')
+
+
+@lru_cache(maxsize=512)
+def issue_url(name, pk):
+    """Cached reverse() for per-issue routes."""
+    return reverse(name, kwargs={'pk': pk})
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(db):
+    """Keep cached responses from leaking between tests."""
+    cache.clear()
 
 
 @pytest.fixture
@@ -48,7 +82,7 @@ class TestIssueEndpoints:
 
     def test_list_issues(self, api_client, create_issue):
         """Test listing issues."""
-        url = reverse('issue-list')
+        url = ISSUE_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -56,10 +90,50 @@ class TestIssueEndpoints:
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'Test Issue'
 
+    def test_list_cache_hit_skips_issue_queries(self, api_client, create_issue):
+        """Test that a cached list page is served without querying issues."""
+        api_client.get(ISSUE_LIST_URL)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(ISSUE_LIST_URL)
+
+        assert response.data['results'][0]['title'] == 'Test Issue'
+        assert not any('tracker_issue' in query['sql'] for query in queries.captured_queries)
+
+    def test_list_cache_invalidated_by_label_changes(
+        self, api_client, create_issue, create_labels, django_capture_on_commit_callbacks
+    ):
+        """Test that cached list pages pick up label changes."""
+        _, label2 = create_labels
+        api_client.get(ISSUE_LIST_URL)
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.put(issue_url('issue-labels', create_issue.id), {'label_ids': [label2.id]}, format='json')
+        response = api_client.get(ISSUE_LIST_URL)
+
+        assert [label['name'] for label in response.data['results'][0]['labels']] == ['feature']
+
+    def test_list_cache_invalidated_by_label_rename(
+        self, api_client, create_issue, create_labels, django_capture_on_commit_callbacks
+    ):
+        """Test that renaming a label refreshes cached list pages."""
+        label1, _ = create_labels
+        api_client.get(ISSUE_LIST_URL)
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.patch(reverse('label-detail', kwargs={'pk': label1.id}), {'name': 'defect'}, format='json')
+        response = api_client.get(ISSUE_LIST_URL)
+
+        assert [label['name'] for label in response.data['results'][0]['labels']] == ['defect']
+
+    def test_list_representation_matches_declared_fields(self, create_issue):
+        """Test that the list fast path matches the generic serializer output."""
+        serializer = IssueListSerializer(create_issue)
+        generic = serializers.ModelSerializer.to_representation(serializer, create_issue)
+
+        assert serializer.data == generic
+
     def test_create_issue(self, api_client, create_users):
         """Test creating a new issue."""
         user1, _ = create_users
-        url = reverse('issue-list')
+        url = ISSUE_LIST_URL
         data = {
             'title': 'New Issue',
             'description': 'New Description',
@@ -74,7 +148,7 @@ class TestIssueEndpoints:
 
     def test_retrieve_issue(self, api_client, create_issue):
         """Test retrieving a single issue."""
-        url = reverse('issue-detail', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-detail', create_issue.id)
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -84,7 +158,7 @@ class TestIssueEndpoints:
 
     def test_update_issue_with_version(self, api_client, create_issue):
         """Test updating an issue with version check."""
-        url = reverse('issue-detail', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-detail', create_issue.id)
         data = {
             'title': 'Updated Issue',
             'version': 1  # Current version
@@ -93,9 +167,21 @@ class TestIssueEndpoints:
 
         assert response.status_code == status.HTTP_200_OK
 
+    def test_partial_update_records_only_changed_fields(self, api_client, create_issue, create_users):
+        """Test that a PATCH omitting the assignee writes no assignee history."""
+        url = issue_url('issue-detail', create_issue.id)
+        api_client.patch(url, {'title': 'Updated Issue', 'version': 1}, format='json')
+        assert not create_issue.history.exists()
+
+        response = api_client.patch(url, {'assignee_id': create_users[0].id, 'version': 2}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert list(create_issue.history.values_list('change_type', 'old_value', 'new_value')) == [
+            ('assignee_changed', str(create_users[1].id), str(create_users[0].id)),
+        ]
+
     def test_update_issue_version_conflict(self, api_client, create_issue):
         """Test version conflict detection."""
-        url = reverse('issue-detail', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-detail', create_issue.id)
         data = {
             'title': 'Updated Issue',
             'version': 99  # Wrong version
@@ -105,6 +191,21 @@ class TestIssueEndpoints:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'version' in response.data
 
+    def test_update_lost_race_is_rejected(self, create_issue):
+        """Test that the conditional UPDATE rejects a write based on a stale read."""
+        stale = Issue.objects.get(pk=create_issue.pk)
+        # Another request bumps the version after our read but before our write
+        Issue.objects.filter(pk=create_issue.pk).update(title='Concurrent', version=2)
+
+        serializer = IssueUpdateSerializer(stale, data={'title': 'Stale', 'version': 1}, partial=True)
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError):
+            IssueViewSet().perform_update(serializer)
+
+        create_issue.refresh_from_db()
+        assert create_issue.title == 'Concurrent'
+        assert create_issue.version == 2
+
 
 class TestCommentEndpoints:
     """Test Comment operations."""
@@ -112,7 +213,7 @@ class TestCommentEndpoints:
     def test_add_comment(self, api_client, create_issue, create_users):
         """Test adding a comment to an issue."""
         user1, _ = create_users
-        url = reverse('issue-comments', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-comments', create_issue.id)
         data = {
             'body': 'This is a test comment',
             'author_id': user1.id
@@ -125,7 +226,7 @@ class TestCommentEndpoints:
     def test_add_empty_comment(self, api_client, create_issue, create_users):
         """Test that empty comments are rejected."""
         user1, _ = create_users
-        url = reverse('issue-comments', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-comments', create_issue.id)
         data = {
             'body': '   ',  # Empty/whitespace
             'author_id': user1.id
@@ -134,22 +235,35 @@ class TestCommentEndpoints:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_blank_comment_rejected_by_database(self, create_issue, create_users):
+        """Test that the check constraint guards writes outside the API."""
+        user1, _ = create_users
+        with pytest.raises(IntegrityError):
+            Comment.objects.create(issue=create_issue, author=user1, body=' \n\t')
+
 
 class TestLabelEndpoints:
     """Test Label operations."""
 
     def test_list_labels(self, api_client, create_labels):
         """Test listing labels."""
-        url = reverse('label-list')
+        url = LABEL_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 2
 
+    def test_create_label_case_insensitive_duplicate(self, api_client, create_labels):
+        """Test that label names are unique regardless of case."""
+        response = api_client.post(LABEL_LIST_URL, {'name': 'BUG'}, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'name' in response.data
+
     def test_replace_issue_labels(self, api_client, create_issue, create_labels):
         """Test replacing labels on an issue."""
         label1, label2 = create_labels
-        url = reverse('issue-labels', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-labels', create_issue.id)
         data = {
             'label_ids': [label1.id, label2.id]
         }
@@ -164,7 +278,7 @@ class TestBulkOperations:
 
     def test_bulk_status_update(self, api_client, create_issue):
         """Test bulk status update."""
-        url = reverse('issue-bulk-status')
+        url = ISSUE_BULK_STATUS_URL
         data = {
             'issue_ids': [create_issue.id],
             'status': 'in_progress'
@@ -174,21 +288,147 @@ class TestBulkOperations:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['updated_count'] == 1
 
+    def test_resolving_stamps_resolved_at_once(self, api_client, create_issue, create_users):
+        """Test that PATCH and bulk updates both keep the first resolved_at stamp."""
+        other = Issue.objects.create(title='Other', reporter=create_users[0], status='open')
+        response = api_client.patch(
+            issue_url('issue-detail', create_issue.id), {'status': 'resolved', 'version': 1}, format='json'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        create_issue.refresh_from_db()
+        first_stamp = create_issue.resolved_at
+        assert first_stamp is not None
+
+        # Reopen, then resolve again through the bulk path
+        api_client.patch(
+            issue_url('issue-detail', create_issue.id), {'status': 'in_progress', 'version': 2}, format='json'
+        )
+        api_client.post(ISSUE_BULK_STATUS_URL, {'issue_ids': [create_issue.id, other.id], 'status': 'resolved'}, format='json')
+        create_issue.refresh_from_db()
+        other.refresh_from_db()
+        assert create_issue.resolved_at == first_stamp
+        assert other.resolved_at is not None
+
+    def test_bulk_status_update_rejects_oversized_batch(self, api_client, create_issue):
+        """Test that bulk updates are capped before reaching the database."""
+        data = {
+            'issue_ids': list(range(1, BULK_STATUS_MAX_ISSUES + 2)),
+            'status': 'in_progress'
+        }
+        response = api_client.post(ISSUE_BULK_STATUS_URL, data, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'issue_ids' in response.data
+
+
+class TestCSVImport:
+    """Test CSV import."""
+
+    def test_import_csv(self, api_client, create_users):
+        """Test that valid rows are created and invalid rows reported."""
+        csv_content = (
+            'title,description,status,reporter_username,assignee_username\n'
+            'First,Imported,open,testuser1,testuser2\n'
+            'Second,,resolved,testuser2,\n'
+            'Orphan,,open,nobody,\n'
+        )
+        upload = SimpleUploadedFile('issues.csv', csv_content.encode('utf-8'), content_type='text/csv')
+        response = api_client.post(ISSUE_IMPORT_URL, {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['total_rows'] == 3
+        assert response.data['successful'] == 2
+        assert response.data['failed'] == 1
+        assert response.data['errors'] == [{'row': 4, 'error': "Reporter 'nobody' not found"}]
+        assert Issue.objects.get(title='Second').resolved_at is not None
+
+    def test_import_csv_rejects_overlong_title(self, api_client, create_users):
+        """Test that a title over max_length is a per-row error, not a failed import."""
+        csv_content = (
+            'title,reporter_username\n'
+            f'{"x" * 256},testuser1\n'
+            'Fits,testuser2\n'
+        )
+        upload = SimpleUploadedFile('issues.csv', csv_content.encode('utf-8'), content_type='text/csv')
+        response = api_client.post(ISSUE_IMPORT_URL, {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['successful'] == 1
+        assert response.data['errors'] == [{'row': 2, 'error': 'Title cannot exceed 255 characters'}]
+        assert list(Issue.objects.values_list('title', flat=True)) == ['Fits']
+
+    def test_import_csv_parallel_chunks(self, api_client, create_users, transactional_db, monkeypatch):
+        """Test that chunks inserted on worker threads are all committed."""
+        monkeypatch.setattr(views, '_csv_import_workers', lambda: 2)
+        monkeypatch.setattr(views, 'CSV_IMPORT_CHUNK_SIZE', 1)
+        csv_content = (
+            'title,reporter_username\n'
+            'First,testuser1\n'
+            'Second,testuser2\n'
+            'Third,testuser1\n'
+        )
+        upload = SimpleUploadedFile('issues.csv', csv_content.encode('utf-8'), content_type='text/csv')
+        response = api_client.post(ISSUE_IMPORT_URL, {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['successful'] == 3
+        assert set(Issue.objects.values_list('title', flat=True)) == {'First', 'Second', 'Third'}
+
+    def test_import_csv_parallel_reports_committed_rows(self, api_client, create_users, transactional_db, monkeypatch):
+        """Test that a failed worker chunk returns 400 with the rows already committed."""
+        monkeypatch.setattr(views, '_csv_import_workers', lambda: 2)
+        monkeypatch.setattr(views, 'CSV_IMPORT_CHUNK_SIZE', 1)
+        bulk_create = Issue.objects.bulk_create
+
+        def failing_bulk_create(objs, **kwargs):
+            if any(issue.title == 'Broken' for issue in objs):
+                raise IntegrityError('simulated insert failure')
+            return bulk_create(objs, **kwargs)
+
+        monkeypatch.setattr(Issue.objects, 'bulk_create', failing_bulk_create)
+        csv_content = (
+            'title,reporter_username\n'
+            'First,testuser1\n'
+            'Orphan,nobody\n'
+            'Broken,testuser1\n'
+            'Third,testuser2\n'
+        )
+        upload = SimpleUploadedFile('issues.csv', csv_content.encode('utf-8'), content_type='text/csv')
+        response = api_client.post(ISSUE_IMPORT_URL, {'file': upload}, format='multipart')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'simulated insert failure' in response.data['error']
+        assert response.data['committed_rows'] == Issue.objects.count() == 2
+        assert response.data['total_rows'] == 4
+        assert response.data['failed'] == 1
+        assert response.data['errors'] == [{'row': 3, 'error': "Reporter 'nobody' not found"}]
+        assert 'successful' not in response.data
+        assert not Issue.objects.filter(title='Broken').exists()
+
 
 class TestReports:
     """Test report endpoints."""
 
     def test_top_assignees(self, api_client, create_issue):
         """Test top assignees report."""
-        url = reverse('top-assignees')
+        url = TOP_ASSIGNEES_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
 
+    def test_top_assignees_limit_is_clamped(self, api_client, create_issue):
+        """Test that out-of-range limits are clamped and bad ones rejected."""
+        response = api_client.get(TOP_ASSIGNEES_URL, {'limit': 0})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 1
+
+        response = api_client.get(TOP_ASSIGNEES_URL, {'limit': 'many'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_latency_report(self, api_client, create_issue):
         """Test latency report."""
-        url = reverse('latency-report')
+        url = LATENCY_REPORT_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -199,9 +439,43 @@ class TestTimeline:
 
     def test_issue_timeline(self, api_client, create_issue):
         """Test getting issue timeline."""
-        url = reverse('issue-timeline', kwargs={'pk': create_issue.id})
+        url = issue_url('issue-timeline', create_issue.id)
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         # Should have at least the creation event
         assert isinstance(response.data, list)
+
+    def test_timeline_matches_history_serializer(self, api_client, create_issue, create_users):
+        """Test that the values()-based timeline keeps the serializer's shape."""
+        user1, _ = create_users
+        IssueHistory.objects.create(
+            issue=create_issue,
+            change_type=IssueHistory.ChangeType.COMMENT_ADDED,
+            changed_by=user1,
+            new_value='Comment added'
+        )
+        IssueHistory.objects.create(issue=create_issue, change_type=IssueHistory.ChangeType.UPDATED)
+        response = api_client.get(issue_url('issue-timeline', create_issue.id))
+
+        assert response.data == IssueHistorySerializer(create_issue.history.all(), many=True).data
+
+
+class TestHealthCheck:
+    """Test the WSGI-level health check."""
+
+    def test_health_bypasses_django(self):
+        """Test that /health/ is answered without calling the wrapped app."""
+        def django_app(environ, start_response):
+            raise AssertionError('Health probe reached Django')
+
+        captured = {}
+
+        def start_response(status_line, headers):
+            captured['status'] = status_line
+
+        app = with_health_check(django_app)
+        body = b''.join(app({'PATH_INFO': '/health/'}, start_response))
+
+        assert captured['status'] == '200 OK'
+        assert json.loads(body) == {'status': 'ok'}
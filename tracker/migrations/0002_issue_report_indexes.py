@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-15 20:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='tracker_iss_status_cd82be_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='tracker_iss_assigne_097e9c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['status', 'created_at'], name='issue_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['assignee', 'status'], name='issue_assignee_status'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('resolved_at__isnull', False)), fields=['resolved_at'], name='issue_resolved_partial'),
+        ),
+    ]
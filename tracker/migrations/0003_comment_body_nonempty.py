@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 20:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0002_issue_report_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='comment',
+            constraint=models.CheckConstraint(check=models.Q(('body__regex', '^\\s*$'), _negated=True), name='comment_body_nonempty'),
+        ),
+    ]
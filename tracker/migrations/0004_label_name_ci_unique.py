@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 20:39
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0003_comment_body_nonempty'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='label',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='label_name_ci_unique'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 20:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0004_label_name_ci_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='issuehistory',
+            name='issue',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='history', to='tracker.issue'),
+        ),
+        migrations.AddIndex(
+            model_name='issuehistory',
+            index=models.Index(fields=['issue', '-timestamp'], name='history_issue_timestamp'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Coalesce, Lower
 from django.utils import timezone
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
@@ -11,6 +13,10 @@ class Label(models.Model):
 
     class Meta:
         ordering = ['name']
+        constraints = [
+            # Backed by a unique index on LOWER(name) for case-insensitive lookups
+            models.UniqueConstraint(Lower('name'), name='label_name_ci_unique'),
+        ]
 
     def __str__(self):
         return self.name
@@ -55,18 +61,39 @@ class Issue(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['status']),
-            models.Index(fields=['assignee']),
+            # Composites lead with status/assignee, so no single-column indexes for those
             models.Index(fields=['created_at']),
+            models.Index(fields=['status', 'created_at'], name='issue_status_created'),
+            models.Index(fields=['assignee', 'status'], name='issue_assignee_status'),
+            models.Index(
+                fields=['resolved_at'],
+                condition=Q(resolved_at__isnull=False),
+                name='issue_resolved_partial',
+            ),
         ]
 
     def __str__(self):
         return f"#{self.id} - {self.title}"
 
+    @classmethod
+    def resolved_at_for(cls, status, resolved_at, now=None):
+        """
+        Return the resolved_at to store for an issue moving to `status`.
+
+        Resolving stamps the time once and keeps an existing stamp. `resolved_at`
+        may be an expression such as F('resolved_at') for queryset updates and
+        bulk inserts, which bypass save().
+        """
+        if status != cls.Status.RESOLVED:
+            return resolved_at
+        now = now or timezone.now()
+        if hasattr(resolved_at, 'resolve_expression'):
+            return Coalesce(resolved_at, Value(now))
+        return resolved_at or now
+
     def save(self, *args, **kwargs):
         # Track when issue is resolved
-        if self.status == self.Status.RESOLVED and not self.resolved_at:
-            self.resolved_at = timezone.now()
+        self.resolved_at = self.resolved_at_for(self.status, self.resolved_at)
         super().save(*args, **kwargs)
 
 
@@ -87,18 +114,21 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        constraints = [
+            # Enforced by the database so non-API writes stay valid without full_clean()
+            models.CheckConstraint(
+                check=~Q(body__regex=r'^\s*$'),
+                name='comment_body_nonempty',
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author.username} on #{self.issue.id}"
 
     def clean(self):
-        if not self.body or not self.body.strip():
+        if not self.body or self.body.isspace():
             raise ValidationError({'body': 'Comment body cannot be empty.'})
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
-
 
 class IssueHistory(models.Model):
     """Track issue changes for timeline feature (bonus)."""
@@ -111,10 +141,13 @@ class IssueHistory(models.Model):
         COMMENT_ADDED = 'comment_added', 'Comment Added'
         UPDATED = 'updated', 'Updated'
 
+    # The composite index in Meta covers issue lookups, so the FK skips its own;
+    # changed_by keeps its index for the SET_NULL update when a user is deleted.
     issue = models.ForeignKey(
         Issue,
         on_delete=models.CASCADE,
-        related_name='history'
+        related_name='history',
+        db_index=False
     )
     change_type = models.CharField(max_length=20, choices=ChangeType.choices)
     changed_by = models.ForeignKey(
@@ -129,6 +162,9 @@ class IssueHistory(models.Model):
     class Meta:
         ordering = ['-timestamp']
         verbose_name_plural = 'Issue histories'
+        indexes = [
+            models.Index(fields=['issue', '-timestamp'], name='history_issue_timestamp'),
+        ]
 
     def __str__(self):
         return f"{self.change_type} on #{self.issue.id} at {self.timestamp}"
@@ -1,52 +1,65 @@
-from datetime import timedelta
-
 from django.contrib.auth.models import User
-from django.db.models import Avg, Count, F, ExpressionWrapper, DurationField
-from django.db.models.functions import Extract
+from django.db.models import Avg, Count, F, Q
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.utils import extend_schema
-from rest_framework import views
+from rest_framework import status, views
 from rest_framework.response import Response
 
 from .models import Issue
 from .serializers import TopAssigneeSerializer, LatencyReportSerializer
 
 
+TOP_ASSIGNEES_DEFAULT_LIMIT = 10
+TOP_ASSIGNEES_MAX_LIMIT = 100
+# Dashboards poll this report; a short cache absorbs repeated hits
+TOP_ASSIGNEES_CACHE_SECONDS = 30
+
+
+def _to_hours(duration):
+    """Convert an aggregated duration (None for empty buckets) to rounded hours."""
+    if not duration:
+        return 0
+    return round(duration.total_seconds() / 3600, 2)
+
+
 class TopAssigneesView(views.APIView):
     """
     GET /reports/top-assignees
 
     Returns top N assignees by number of assigned issues.
     Query params:
-    - limit: Number of top assignees to return (default: 10)
+    - limit: Number of top assignees to return (default: 10, max: 100)
     """
 
     @extend_schema(
         responses={200: TopAssigneeSerializer(many=True)},
         description="Get top assignees by issue count"
     )
+    @method_decorator(cache_page(TOP_ASSIGNEES_CACHE_SECONDS))
+    @method_decorator(vary_on_headers('Accept', 'Authorization'))
     def get(self, request):
-        limit = int(request.query_params.get('limit', 10))
+        try:
+            limit = int(request.query_params.get('limit', TOP_ASSIGNEES_DEFAULT_LIMIT))
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), TOP_ASSIGNEES_MAX_LIMIT)
 
+        # Rows already have the response shape; TopAssigneeSerializer only documents it
         top_assignees = (
             User.objects
             .filter(assigned_issues__isnull=False)
+            .values('username', assignee_id=F('id'))
             .annotate(issue_count=Count('assigned_issues'))
-            .order_by('-issue_count')
-            .values('id', 'username', 'issue_count')[:limit]
+            .order_by('-issue_count')[:limit]
         )
 
-        result = [
-            {
-                'assignee_id': a['id'],
-                'username': a['username'],
-                'issue_count': a['issue_count']
-            }
-            for a in top_assignees
-        ]
-
-        serializer = TopAssigneeSerializer(result, many=True)
-        return Response(serializer.data)
+        return Response(list(top_assignees))
 
 
 class LatencyReportView(views.APIView):
@@ -62,64 +75,35 @@ class LatencyReportView(views.APIView):
         description="Get average resolution time report"
     )
     def get(self, request):
-        # Calculate resolution time for resolved issues
-        resolved_issues = (
-            Issue.objects
-            .filter(resolved_at__isnull=False)
-            .annotate(
-                resolution_time=ExpressionWrapper(
-                    F('resolved_at') - F('created_at'),
-                    output_field=DurationField()
-                )
-            )
+        now = timezone.now()
+        resolved = Q(resolved_at__isnull=False)
+        open_ = Q(status=Issue.Status.OPEN)
+        in_progress = Q(status=Issue.Status.IN_PROGRESS)
+
+        # Single round trip: conditional aggregates for every bucket
+        stats = Issue.objects.aggregate(
+            resolved_avg=Avg(F('resolved_at') - F('created_at'), filter=resolved),
+            resolved_count=Count('id', filter=resolved),
+            open_avg=Avg(now - F('created_at'), filter=open_),
+            open_count=Count('id', filter=open_),
+            in_progress_avg=Avg(now - F('created_at'), filter=in_progress),
+            in_progress_count=Count('id', filter=in_progress),
         )
 
-        overall_stats = []
-
-        # Get average resolution time for all resolved issues
-        avg_duration = resolved_issues.aggregate(
-            avg_resolution=Avg(F('resolved_at') - F('created_at'))
-        )['avg_resolution']
-
-        if avg_duration:
-            avg_hours = avg_duration.total_seconds() / 3600
-        else:
-            avg_hours = 0
-
-        overall_stats.append({
+        overall_stats = [{
             'status': 'resolved',
-            'avg_resolution_hours': round(avg_hours, 2),
-            'issue_count': resolved_issues.count()
-        })
-
-        # Stats for currently open issues (time since creation)
-        open_issues = Issue.objects.filter(status=Issue.Status.OPEN)
-        in_progress_issues = Issue.objects.filter(status=Issue.Status.IN_PROGRESS)
-
-        now = timezone.now()
-
-        # Open issues average age
-        if open_issues.exists():
-            open_avg = open_issues.aggregate(
-                avg_age=Avg(now - F('created_at'))
-            )['avg_age']
-            if open_avg:
-                overall_stats.append({
-                    'status': 'open',
-                    'avg_resolution_hours': round(open_avg.total_seconds() / 3600, 2),
-                    'issue_count': open_issues.count()
-                })
-
-        # In progress issues average age
-        if in_progress_issues.exists():
-            in_progress_avg = in_progress_issues.aggregate(
-                avg_age=Avg(now - F('created_at'))
-            )['avg_age']
-            if in_progress_avg:
+            'avg_resolution_hours': _to_hours(stats['resolved_avg']),
+            'issue_count': stats['resolved_count']
+        }]
+
+        # Currently open / in progress issues (time since creation)
+        for bucket in ('open', 'in_progress'):
+            bucket_avg = stats[f'{bucket}_avg']
+            if stats[f'{bucket}_count'] and bucket_avg:
                 overall_stats.append({
-                    'status': 'in_progress',
-                    'avg_resolution_hours': round(in_progress_avg.total_seconds() / 3600, 2),
-                    'issue_count': in_progress_issues.count()
+                    'status': bucket,
+                    'avg_resolution_hours': _to_hours(bucket_avg),
+                    'issue_count': stats[f'{bucket}_count']
                 })
 
         serializer = LatencyReportSerializer(overall_stats, many=True)
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.functions import Lower
 from .models import Issue, Comment, Label, IssueHistory
 
 
@@ -17,11 +19,24 @@ class LabelSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'created_at']
         read_only_fields = ['created_at']
 
+    def validate_name(self, value):
+        duplicates = Label.objects.annotate(name_lower=Lower('name')).filter(name_lower=value.lower())
+        if self.instance:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError("Label with this name already exists.")
+        return value
+
 
 class CommentSerializer(serializers.ModelSerializer):
     """Serializer for Comment model."""
     author = UserSerializer(read_only=True)
-    author_id = serializers.IntegerField(write_only=True)
+    author_id = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(),
+        source='author',
+        write_only=True,
+        error_messages={'does_not_exist': 'Author does not exist.'}
+    )
 
     class Meta:
         model = Comment
@@ -29,14 +44,28 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at']
 
     def validate_body(self, value):
-        if not value or not value.strip():
+        # isspace() scans in place instead of allocating a stripped copy
+        if not value or value.isspace():
             raise serializers.ValidationError("Comment body cannot be empty.")
         return value.strip()
 
-    def validate_author_id(self, value):
-        if not User.objects.filter(id=value).exists():
-            raise serializers.ValidationError("Author does not exist.")
-        return value
+
+# Shared field instance so the list fast path formats datetimes exactly like DRF
+_datetime_field = serializers.DateTimeField()
+
+
+def _user_representation(user):
+    if user is None:
+        return None
+    return {'id': user.id, 'username': user.username, 'email': user.email}
+
+
+def _label_representation(label):
+    return {
+        'id': label.id,
+        'name': label.name,
+        'created_at': _datetime_field.to_representation(label.created_at),
+    }
 
 
 class IssueListSerializer(serializers.ModelSerializer):
@@ -53,6 +82,21 @@ class IssueListSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
 
+    def to_representation(self, instance):
+        # Hand-built output for the hot list path; the declared fields above
+        # still drive the OpenAPI schema and must stay in sync with this dict.
+        return {
+            'id': instance.id,
+            'title': instance.title,
+            'status': instance.status,
+            'version': instance.version,
+            'reporter': _user_representation(instance.reporter),
+            'assignee': _user_representation(instance.assignee),
+            'labels': [_label_representation(label) for label in instance.labels.all()],
+            'created_at': _datetime_field.to_representation(instance.created_at),
+            'updated_at': _datetime_field.to_representation(instance.updated_at),
+        }
+
 
 class IssueDetailSerializer(serializers.ModelSerializer):
     """Serializer for issue details with comments."""
@@ -72,8 +116,18 @@ class IssueDetailSerializer(serializers.ModelSerializer):
 
 class IssueCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating issues."""
-    reporter_id = serializers.IntegerField()
-    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reporter_id = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(),
+        source='reporter',
+        error_messages={'does_not_exist': 'Reporter does not exist.'}
+    )
+    assignee_id = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(),
+        source='assignee',
+        required=False,
+        allow_null=True,
+        error_messages={'does_not_exist': 'Assignee does not exist.'}
+    )
     label_ids = serializers.ListField(
         child=serializers.IntegerField(),
         required=False,
@@ -89,38 +143,24 @@ class IssueCreateSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'version', 'created_at']
 
-    def validate_reporter_id(self, value):
-        if not User.objects.filter(id=value).exists():
-            raise serializers.ValidationError("Reporter does not exist.")
-        return value
-
-    def validate_assignee_id(self, value):
-        if value and not User.objects.filter(id=value).exists():
-            raise serializers.ValidationError("Assignee does not exist.")
-        return value
-
     def create(self, validated_data):
         label_ids = validated_data.pop('label_ids', [])
-        reporter_id = validated_data.pop('reporter_id')
-        assignee_id = validated_data.pop('assignee_id', None)
-
-        issue = Issue.objects.create(
-            reporter_id=reporter_id,
-            assignee_id=assignee_id,
-            **validated_data
-        )
-
-        if label_ids:
-            labels = Label.objects.filter(id__in=label_ids)
-            issue.labels.set(labels)
-
-        # Record history
-        IssueHistory.objects.create(
-            issue=issue,
-            change_type=IssueHistory.ChangeType.CREATED,
-            changed_by_id=reporter_id,
-            new_value=f"Created issue: {issue.title}"
-        )
+
+        with transaction.atomic():
+            # reporter/assignee arrive as User instances already fetched during validation
+            issue = Issue.objects.create(**validated_data)
+
+            if label_ids:
+                labels = Label.objects.filter(id__in=label_ids)
+                issue.labels.set(labels)
+
+            # Record history
+            IssueHistory.objects.create(
+                issue=issue,
+                change_type=IssueHistory.ChangeType.CREATED,
+                changed_by=issue.reporter,
+                new_value=f"Created issue: {issue.title}"
+            )
 
         return issue
 
@@ -128,17 +168,18 @@ class IssueCreateSerializer(serializers.ModelSerializer):
 class IssueUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating issues with version check."""
     version = serializers.IntegerField(required=True)
-    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    assignee_id = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(),
+        source='assignee',
+        required=False,
+        allow_null=True,
+        error_messages={'does_not_exist': 'Assignee does not exist.'}
+    )
 
     class Meta:
         model = Issue
         fields = ['title', 'description', 'status', 'version', 'assignee_id']
 
-    def validate_assignee_id(self, value):
-        if value and not User.objects.filter(id=value).exists():
-            raise serializers.ValidationError("Assignee does not exist.")
-        return value
-
     def validate(self, attrs):
         instance = self.instance
         if instance and attrs.get('version') != instance.version:
@@ -148,11 +189,16 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 
+# Upper bound on ids per bulk request; keeps the id__in lists well under driver parameter limits
+BULK_STATUS_MAX_ISSUES = 1000
+
+
 class BulkStatusUpdateSerializer(serializers.Serializer):
     """Serializer for bulk status updates."""
     issue_ids = serializers.ListField(
         child=serializers.IntegerField(),
-        min_length=1
+        min_length=1,
+        max_length=BULK_STATUS_MAX_ISSUES
     )
     status = serializers.ChoiceField(choices=Issue.Status.choices)
 
@@ -173,6 +219,32 @@ class IssueHistorySerializer(serializers.ModelSerializer):
         fields = ['id', 'change_type', 'changed_by', 'old_value', 'new_value', 'timestamp']
 
 
+# Columns to pass to values() for history_row_representation
+ISSUE_HISTORY_VALUES = (
+    'id', 'change_type', 'old_value', 'new_value', 'timestamp',
+    'changed_by_id', 'changed_by__username', 'changed_by__email',
+)
+
+
+def history_row_representation(row):
+    """Render a history values() row in the same shape as IssueHistorySerializer."""
+    changed_by = None
+    if row['changed_by_id'] is not None:
+        changed_by = {
+            'id': row['changed_by_id'],
+            'username': row['changed_by__username'],
+            'email': row['changed_by__email'],
+        }
+    return {
+        'id': row['id'],
+        'change_type': row['change_type'],
+        'changed_by': changed_by,
+        'old_value': row['old_value'],
+        'new_value': row['new_value'],
+        'timestamp': _datetime_field.to_representation(row['timestamp']),
+    }
+
+
 class CSVImportResultSerializer(serializers.Serializer):
     """Serializer for CSV import response."""
     total_rows = serializers.IntegerField()
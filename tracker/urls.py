@@ -1,12 +1,12 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import IssueViewSet, LabelViewSet, CommentViewSet
 from .reports import TopAssigneesView, LatencyReportView
 
 
-# Create router for viewsets
-router = DefaultRouter()
+# SimpleRouter: no API root view or format-suffix patterns to resolve through
+router = SimpleRouter()
 router.register(r'issues', IssueViewSet, basename='issue')
 router.register(r'labels', LabelViewSet, basename='label')
 router.register(r'comments', CommentViewSet, basename='comment')
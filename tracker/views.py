@@ -1,12 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import io
+import uuid
 
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db import transaction
-from django.db.models import F
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+from django.db.models import F, Prefetch
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
 import pandas as pd
-from rest_framework import viewsets, status, filters
+from rest_framework import viewsets, serializers, status, filters
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
@@ -16,11 +22,68 @@ from .serializers import (
     IssueListSerializer, IssueDetailSerializer,
     IssueCreateSerializer, IssueUpdateSerializer,
     CommentSerializer, LabelSerializer,
-    BulkStatusUpdateSerializer, LabelAssignmentSerializer,
-    IssueHistorySerializer,
+    BulkStatusUpdateSerializer, BULK_STATUS_MAX_ISSUES, LabelAssignmentSerializer,
+    IssueHistorySerializer, ISSUE_HISTORY_VALUES, history_row_representation,
 )
 
 
+# Columns rendered by IssueListSerializer; skips description and unused User columns
+ISSUE_LIST_FIELDS = (
+    'id', 'title', 'status', 'version', 'created_at', 'updated_at',
+    'reporter__id', 'reporter__username', 'reporter__email',
+    'assignee__id', 'assignee__username', 'assignee__email',
+)
+# IssueDetailSerializer adds the long-form columns but still only needs id/username/email per user
+ISSUE_DETAIL_FIELDS = ISSUE_LIST_FIELDS + ('description', 'resolved_at')
+# Columns CommentSerializer renders, plus the issue FK the prefetch groups on
+COMMENT_PREFETCH_FIELDS = (
+    'id', 'issue', 'body', 'created_at',
+    'author__id', 'author__username', 'author__email',
+)
+
+CSV_IMPORT_COLUMNS = ('title', 'description', 'status', 'reporter_username', 'assignee_username')
+CSV_IMPORT_REQUIRED_COLUMNS = ('title', 'reporter_username')
+VALID_STATUSES = frozenset(s[0] for s in Issue.Status.choices)
+TITLE_MAX_LENGTH = Issue._meta.get_field('title').max_length
+CSV_IMPORT_CHUNK_SIZE = 5000
+
+ISSUE_LIST_CACHE_SECONDS = 300
+ISSUE_LIST_NAMESPACE_KEY = 'issues:list:namespace'
+
+
+def _issue_list_cache_namespace():
+    return cache.get_or_set(ISSUE_LIST_NAMESPACE_KEY, lambda: uuid.uuid4().hex, timeout=None)
+
+
+def _csv_import_workers():
+    # Parallel inserts commit per chunk; SQLite would just serialize the writers
+    if connection.vendor != 'postgresql':
+        return 1
+    return settings.CSV_IMPORT_WORKERS
+
+
+def _insert_import_chunk(issues):
+    # Runs on a worker thread, which gets its own connection; close it so the
+    # pool thread doesn't keep it open after the import finishes
+    try:
+        with transaction.atomic():
+            Issue.objects.bulk_create(issues, batch_size=1000)
+        return len(issues)
+    finally:
+        connection.close()
+
+
+def invalidate_issue_list_cache():
+    """Drop every cached issue list page once the current transaction commits.
+
+    Waiting for the commit keeps a concurrent request from caching the old rows
+    under the new namespace.
+    """
+    transaction.on_commit(
+        lambda: cache.set(ISSUE_LIST_NAMESPACE_KEY, uuid.uuid4().hex, timeout=None)
+    )
+
+
 class IssueViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Issue CRUD operations.
@@ -35,11 +98,44 @@ class IssueViewSet(viewsets.ModelViewSet):
     - Label management
     - Timeline (history)
     """
-    queryset = Issue.objects.select_related('reporter', 'assignee').prefetch_related('labels', 'comments')
+    queryset = Issue.objects.select_related('reporter', 'assignee')
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'assignee', 'reporter']
     search_fields = ['title', 'description']
     ordering_fields = ['created_at', 'updated_at', 'status']
+    # Default sort served by the created_at and (status, created_at) indexes
+    ordering = ['-created_at']
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            return queryset.only(*ISSUE_LIST_FIELDS).prefetch_related('labels')
+        if self.action == 'retrieve':
+            return queryset.only(*ISSUE_DETAIL_FIELDS).prefetch_related(
+                'labels',
+                Prefetch(
+                    'comments',
+                    queryset=Comment.objects.select_related('author').only(*COMMENT_PREFETCH_FIELDS),
+                ),
+            )
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """List issues, serving repeat requests from cache until an issue or label write."""
+        # A hit costs two cache lookups and no issue queries; writes rotate the namespace
+        key_source = '|'.join([
+            _issue_list_cache_namespace(),
+            request.build_absolute_uri(),
+        ])
+        cache_key = 'issues:list:' + hashlib.md5(key_source.encode('utf-8')).hexdigest()
+
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, ISSUE_LIST_CACHE_SECONDS)
+        return response
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -52,36 +148,74 @@ class IssueViewSet(viewsets.ModelViewSet):
             return IssueUpdateSerializer
         return IssueDetailSerializer
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        invalidate_issue_list_cache()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_issue_list_cache()
+
     def perform_update(self, serializer):
         """Update issue with version increment and history tracking."""
         instance = serializer.instance
         old_status = instance.status
         old_assignee = instance.assignee_id
 
-        # Increment version
-        serializer.save(version=F('version') + 1)
-
-        # Refresh to get actual values after F() expression
-        instance.refresh_from_db()
-
-        # Track status change
-        if 'status' in serializer.validated_data and serializer.validated_data['status'] != old_status:
-            IssueHistory.objects.create(
-                issue=instance,
-                change_type=IssueHistory.ChangeType.STATUS_CHANGED,
-                old_value=old_status,
-                new_value=serializer.validated_data['status']
+        changes = dict(serializer.validated_data)
+        expected_version = changes.pop('version')
+        now = timezone.now()
+        if 'status' in changes:
+            # update() bypasses Issue.save(), so apply its resolved_at rule here
+            changes['resolved_at'] = Issue.resolved_at_for(changes['status'], instance.resolved_at, now)
+
+        with transaction.atomic():
+            # Compare-and-swap on version: a concurrent writer makes this match no rows
+            new_version = expected_version + 1
+            updated = Issue.objects.filter(pk=instance.pk, version=expected_version).update(
+                version=new_version,
+                updated_at=now,
+                **changes
             )
+            if not updated:
+                raise serializers.ValidationError({
+                    'version': 'Version conflict. The issue was modified by another request.'
+                })
 
-        # Track assignee change
-        new_assignee = serializer.validated_data.get('assignee_id')
-        if new_assignee != old_assignee:
-            IssueHistory.objects.create(
-                issue=instance,
-                change_type=IssueHistory.ChangeType.ASSIGNEE_CHANGED,
-                old_value=str(old_assignee) if old_assignee else None,
-                new_value=str(new_assignee) if new_assignee else None
-            )
+            # Mirror the written values locally instead of re-reading the row
+            for field, value in changes.items():
+                setattr(instance, field, value)
+            instance.version = new_version
+            instance.updated_at = now
+
+            history = []
+
+            # Track status change
+            if 'status' in serializer.validated_data and serializer.validated_data['status'] != old_status:
+                history.append(IssueHistory(
+                    issue_id=instance.pk,
+                    change_type=IssueHistory.ChangeType.STATUS_CHANGED,
+                    old_value=old_status,
+                    new_value=serializer.validated_data['status']
+                ))
+
+            # Track assignee change; a PATCH that omits the assignee leaves it as is
+            if 'assignee' in serializer.validated_data:
+                new_assignee = serializer.validated_data['assignee']
+                new_assignee = new_assignee.pk if new_assignee else None
+                if new_assignee != old_assignee:
+                    history.append(IssueHistory(
+                        issue_id=instance.pk,
+                        change_type=IssueHistory.ChangeType.ASSIGNEE_CHANGED,
+                        old_value=str(old_assignee) if old_assignee else None,
+                        new_value=str(new_assignee) if new_assignee else None
+                    ))
+
+            # One INSERT for all events, committed together with the update
+            if history:
+                IssueHistory.objects.bulk_create(history)
+
+            invalidate_issue_list_cache()
 
     @action(detail=True, methods=['post'])
     def comments(self, request, pk=None):
@@ -90,19 +224,21 @@ class IssueViewSet(viewsets.ModelViewSet):
         serializer = CommentSerializer(data=request.data)
 
         if serializer.is_valid():
-            comment = Comment.objects.create(
-                issue=issue,
-                author_id=serializer.validated_data['author_id'],
-                body=serializer.validated_data['body']
-            )
+            # One transaction, one commit for the comment and its history row
+            with transaction.atomic():
+                comment = Comment.objects.create(
+                    issue=issue,
+                    author=serializer.validated_data['author'],
+                    body=serializer.validated_data['body']
+                )
 
-            # Track in history
-            IssueHistory.objects.create(
-                issue=issue,
-                change_type=IssueHistory.ChangeType.COMMENT_ADDED,
-                changed_by_id=serializer.validated_data['author_id'],
-                new_value=f"Comment added: {comment.body[:100]}..."
-            )
+                # Track in history
+                IssueHistory.objects.create(
+                    issue=issue,
+                    change_type=IssueHistory.ChangeType.COMMENT_ADDED,
+                    changed_by=comment.author,
+                    new_value=f"Comment added: {comment.body[:100]}..."
+                )
 
             return Response(
                 CommentSerializer(comment).data,
@@ -117,44 +253,59 @@ class IssueViewSet(viewsets.ModelViewSet):
         serializer = LabelAssignmentSerializer(data=request.data)
 
         if serializer.is_valid():
-            old_labels = list(issue.labels.values_list('name', flat=True))
+            new_ids = set(serializer.validated_data['label_ids'])
 
             with transaction.atomic():
-                label_ids = serializer.validated_data['label_ids']
-                labels = Label.objects.filter(id__in=label_ids)
-
-                if len(labels) != len(label_ids):
-                    found_ids = set(labels.values_list('id', flat=True))
-                    missing_ids = set(label_ids) - found_ids
+                # Lock the issue so concurrent replacements can't diff against a stale set
+                Issue.objects.select_for_update(no_key=True).filter(pk=issue.pk).exists()
+                old_labels = list(issue.labels.only('id', 'name'))
+                old_ids = {label.id for label in old_labels}
+                labels = list(Label.objects.filter(id__in=new_ids))
+
+                missing_ids = new_ids - {label.id for label in labels}
+                if missing_ids:
                     return Response(
                         {'error': f'Labels not found: {list(missing_ids)}'},
                         status=status.HTTP_400_BAD_REQUEST
                     )
 
-                issue.labels.set(labels)
+                # Apply only the difference; set() would re-read the current rows first
+                IssueLabel = Issue.labels.through
+                removed_ids = old_ids - new_ids
+                added_ids = new_ids - old_ids
+                if removed_ids:
+                    IssueLabel.objects.filter(issue_id=issue.id, label_id__in=removed_ids).delete()
+                if added_ids:
+                    IssueLabel.objects.bulk_create(
+                        [IssueLabel(issue_id=issue.id, label_id=label_id) for label_id in added_ids],
+                        ignore_conflicts=True
+                    )
+
+                invalidate_issue_list_cache()
 
                 # Track in history
-                new_labels = list(labels.values_list('name', flat=True))
                 IssueHistory.objects.create(
                     issue=issue,
                     change_type=IssueHistory.ChangeType.LABELS_CHANGED,
-                    old_value=', '.join(old_labels),
-                    new_value=', '.join(new_labels)
+                    old_value=', '.join(label.name for label in old_labels),
+                    new_value=', '.join(label.name for label in labels)
                 )
 
+            # `labels` already holds the new set (ordered by name), no need to re-query
             return Response(
-                LabelSerializer(issue.labels.all(), many=True).data,
+                LabelSerializer(labels, many=True).data,
                 status=status.HTTP_200_OK
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(responses={200: IssueHistorySerializer(many=True)})
     @action(detail=True, methods=['get'])
     def timeline(self, request, pk=None):
         """Get issue history/timeline (bonus feature)."""
         issue = self.get_object()
-        history = issue.history.all()
-        serializer = IssueHistorySerializer(history, many=True)
-        return Response(serializer.data)
+        # Plain values() rows streamed from the DB, rendered without serializer field resolution
+        rows = issue.history.values(*ISSUE_HISTORY_VALUES).iterator(chunk_size=2000)
+        return Response([history_row_representation(row) for row in rows])
 
     @action(detail=False, methods=['post'], url_path='bulk-status')
     def bulk_status(self, request):
@@ -167,36 +318,53 @@ class IssueViewSet(viewsets.ModelViewSet):
 
             try:
                 with transaction.atomic():
-                    issues = Issue.objects.select_for_update().filter(id__in=issue_ids)
+                    # One locking query fetches just what validation needs. FOR NO KEY UPDATE
+                    # on the issue rows only: blocks concurrent writers without also
+                    # blocking inserts that reference these issues by FK
+                    locked_rows = list(
+                        Issue.objects
+                        .select_for_update(of=('self',), no_key=True)
+                        .filter(id__in=issue_ids)
+                        .values('id', 'status')
+                    )
 
-                    if issues.count() != len(issue_ids):
-                        found_ids = set(issues.values_list('id', flat=True))
-                        missing_ids = set(issue_ids) - found_ids
+                    missing_ids = set(issue_ids) - {row['id'] for row in locked_rows}
+                    if missing_ids:
                         raise ValueError(f"Issues not found: {list(missing_ids)}")
 
                     # Validate status transitions
-                    for issue in issues:
+                    for row in locked_rows:
                         # Example rule: can't reopen closed issues
-                        if issue.status == Issue.Status.CLOSED and new_status != Issue.Status.CLOSED:
-                            raise ValueError(f"Cannot reopen closed issue #{issue.id}")
-
-                    # Perform the update
-                    updated_count = 0
-                    for issue in issues:
-                        old_status = issue.status
-                        if old_status != new_status:
-                            issue.status = new_status
-                            issue.version = F('version') + 1
-                            issue.save()
-
-                            # Track history
-                            IssueHistory.objects.create(
-                                issue=issue,
-                                change_type=IssueHistory.ChangeType.STATUS_CHANGED,
-                                old_value=old_status,
-                                new_value=new_status
-                            )
-                            updated_count += 1
+                        if row['status'] == Issue.Status.CLOSED and new_status != Issue.Status.CLOSED:
+                            raise ValueError(f"Cannot reopen closed issue #{row['id']}")
+
+                    to_update = [row for row in locked_rows if row['status'] != new_status]
+                    changed_by_id = request.user.id  # None for anonymous requests
+                    history_rows = [
+                        IssueHistory(
+                            issue_id=row['id'],
+                            change_type=IssueHistory.ChangeType.STATUS_CHANGED,
+                            changed_by_id=changed_by_id,
+                            old_value=row['status'],
+                            new_value=new_status
+                        )
+                        for row in to_update
+                    ]
+
+                    # Perform the update as a single statement
+                    now = timezone.now()
+                    update_kwargs = {
+                        'status': new_status,
+                        'version': F('version') + 1,
+                        'updated_at': now,
+                        'resolved_at': Issue.resolved_at_for(new_status, F('resolved_at'), now),
+                    }
+                    Issue.objects.filter(id__in=[row['id'] for row in to_update]).update(**update_kwargs)
+
+                    # Track history
+                    IssueHistory.objects.bulk_create(history_rows, batch_size=BULK_STATUS_MAX_ISSUES)
+                    invalidate_issue_list_cache()
+                    updated_count = len(to_update)
 
                     return Response({
                         'message': f'Successfully updated {updated_count} issues',
@@ -226,85 +394,170 @@ class IssueViewSet(viewsets.ModelViewSet):
 
         csv_file = request.FILES['file']
 
+        # Stream the upload in chunks rather than decoding it into one string/frame
         try:
-            df = pd.read_csv(io.StringIO(csv_file.read().decode('utf-8')))
+            reader = pd.read_csv(
+                io.TextIOWrapper(csv_file.file, encoding='utf-8'),
+                chunksize=CSV_IMPORT_CHUNK_SIZE,
+                usecols=lambda column: column in CSV_IMPORT_COLUMNS,
+                dtype=str
+            )
         except Exception as e:
             return Response(
                 {'error': f'Failed to parse CSV: {str(e)}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        required_columns = ['title', 'reporter_username']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            return Response(
-                {'error': f'Missing required columns: {missing_columns}'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
         results = {
-            'total_rows': len(df),
+            'total_rows': 0,
             'successful': 0,
             'failed': 0,
             'errors': []
         }
 
-        # Cache users for performance
-        usernames = set(df['reporter_username'].dropna().tolist())
-        if 'assignee_username' in df.columns:
-            usernames.update(df['assignee_username'].dropna().tolist())
-        users = {u.username: u for u in User.objects.filter(username__in=usernames)}
+        # username -> id, cached across chunks; each chunk only queries names not seen yet
+        user_ids = {}
+        seen_usernames = set()
 
-        for idx, row in df.iterrows():
-            row_num = idx + 2  # Account for header and 0-indexing
+        workers = _csv_import_workers()
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        chunks = []
+        error = None
 
-            try:
-                # Validate reporter
-                reporter_username = row.get('reporter_username')
-                if pd.isna(reporter_username) or reporter_username not in users:
-                    raise ValueError(f"Reporter '{reporter_username}' not found")
-                reporter = users[reporter_username]
-
-                # Validate assignee if provided
-                assignee = None
-                assignee_username = row.get('assignee_username')
-                if not pd.isna(assignee_username) and assignee_username:
-                    if assignee_username not in users:
-                        raise ValueError(f"Assignee '{assignee_username}' not found")
-                    assignee = users[assignee_username]
-
-                # Validate status
-                status_value = row.get('status', 'open')
-                if pd.isna(status_value):
-                    status_value = 'open'
-                valid_statuses = [s[0] for s in Issue.Status.choices]
-                if status_value not in valid_statuses:
-                    raise ValueError(f"Invalid status '{status_value}'")
-
-                # Validate title
-                title = row.get('title')
-                if pd.isna(title) or not str(title).strip():
-                    raise ValueError("Title cannot be empty")
-
-                # Create issue
-                Issue.objects.create(
-                    title=str(title).strip(),
-                    description=str(row.get('description', '')).strip() if not pd.isna(row.get('description')) else '',
-                    status=status_value,
-                    reporter=reporter,
-                    assignee=assignee
+        try:
+            with transaction.atomic():
+                for df in reader:
+                    missing_columns = [col for col in CSV_IMPORT_REQUIRED_COLUMNS if col not in df.columns]
+                    if missing_columns:
+                        return Response(
+                            {'error': f'Missing required columns: {missing_columns}'},
+                            status=status.HTTP_400_BAD_REQUEST
+                        )
+
+                    username_columns = [df['reporter_username']]
+                    if 'assignee_username' in df.columns:
+                        username_columns.append(df['assignee_username'])
+                    usernames = set(pd.unique(pd.concat(username_columns).dropna()))
+                    new_usernames = usernames - seen_usernames
+                    if new_usernames:
+                        seen_usernames |= new_usernames
+                        user_ids.update(
+                            User.objects.filter(username__in=new_usernames).values_list('username', 'id')
+                        )
+
+                    to_create, errors = self._build_import_issues(df, user_ids)
+                    if executor is None:
+                        Issue.objects.bulk_create(to_create, batch_size=1000)
+                    else:
+                        # Bound in-flight chunks so parsing can't run far ahead of the inserts
+                        if len(chunks) >= workers:
+                            chunks[-workers].result()
+                        chunks.append(executor.submit(_insert_import_chunk, to_create))
+
+                    results['total_rows'] += len(df)
+                    results['successful'] += len(to_create)
+                    results['failed'] += len(errors)
+                    results['errors'].extend(errors)
+
+            # Surface insert errors from chunks still running on the workers
+            for future in chunks:
+                future.result()
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            # Raised mid-stream; serial imports roll back earlier chunks with the atomic block
+            error = f'Failed to parse CSV: {str(e)}'
+        except DatabaseError as e:
+            if executor is None:
+                raise
+            error = f'Failed to import rows: {str(e)}'
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        # Outside the atomic block, so this runs now; parallel chunks may have committed on error
+        invalidate_issue_list_cache()
+
+        if error is not None:
+            response = {'error': error}
+            if executor is not None:
+                # Worker chunks commit independently: report the rows saved before the failure
+                # and the validation errors so far. `successful` is left out because validated
+                # rows in the failed chunk were never saved
+                response.update(
+                    total_rows=results['total_rows'],
+                    failed=results['failed'],
+                    errors=results['errors'],
+                    committed_rows=sum(
+                        future.result() for future in chunks if future.exception() is None
+                    ),
                 )
-                results['successful'] += 1
-
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append({
-                    'row': row_num,
-                    'error': str(e)
-                })
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(results, status=status.HTTP_201_CREATED if results['successful'] > 0 else status.HTTP_400_BAD_REQUEST)
 
+    @staticmethod
+    def _build_import_issues(df, user_ids):
+        """
+        Validate an import frame column-wise and build unsaved issues.
+
+        Returns the issues for valid rows and an error entry for each invalid row.
+        """
+        def column(name, default):
+            if name in df.columns:
+                return df[name]
+            return pd.Series(default, index=df.index, dtype=object)
+
+        titles = df['title'].astype('string').str.strip().fillna('')
+        descriptions = column('description', '').astype('string').str.strip().fillna('')
+        statuses = column('status', Issue.Status.OPEN).fillna(Issue.Status.OPEN)
+        reporters = df['reporter_username']
+        assignees = column('assignee_username', None)
+
+        # Boolean masks evaluated in pandas instead of per-cell Python checks
+        bad_reporter = ~reporters.isin(user_ids.keys())
+        bad_assignee = assignees.notna() & ~assignees.isin(user_ids.keys())
+        bad_status = ~statuses.isin(VALID_STATUSES)
+        bad_title = titles == ''
+        # The database rejects these (PostgreSQL raises DataError), failing the whole batch
+        long_title = titles.str.len() > TITLE_MAX_LENGTH
+        invalid = bad_reporter | bad_assignee | bad_status | bad_title | long_title
+
+        # Only the (usually small) invalid subset is walked in Python
+        errors = []
+        for idx in df.index[invalid]:
+            if bad_reporter[idx]:
+                message = f"Reporter '{reporters[idx]}' not found"
+            elif bad_assignee[idx]:
+                message = f"Assignee '{assignees[idx]}' not found"
+            elif bad_status[idx]:
+                message = f"Invalid status '{statuses[idx]}'"
+            elif long_title[idx]:
+                message = f"Title cannot exceed {TITLE_MAX_LENGTH} characters"
+            else:
+                message = "Title cannot be empty"
+            errors.append({
+                'row': idx + 2,  # Account for header and 0-indexing
+                'error': message
+            })
+
+        valid = ~invalid
+        now = timezone.now()
+        issues = [
+            Issue(
+                title=title,
+                description=description,
+                status=status_value,
+                reporter_id=user_ids[reporter],
+                assignee_id=user_ids.get(assignee),
+                # bulk_create skips Issue.save(), so apply its resolved_at rule here
+                resolved_at=Issue.resolved_at_for(status_value, None, now)
+            )
+            for title, description, status_value, reporter, assignee in zip(
+                titles[valid], descriptions[valid], statuses[valid],
+                reporters[valid], assignees[valid]
+            )
+        ]
+        return issues, errors
+
 
 class LabelViewSet(viewsets.ModelViewSet):
     """ViewSet for Label CRUD operations."""
@@ -313,6 +566,15 @@ class LabelViewSet(viewsets.ModelViewSet):
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
 
+    # Issue lists embed labels, so renames and deletions must refresh them
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        invalidate_issue_list_cache()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_issue_list_cache()
+
 
 class CommentViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for reading comments (creation via issues endpoint)."""